@@ -12,9 +12,35 @@ from __future__ import annotations
 import json
 import os
 import re
+import time
 from functools import lru_cache
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, NamedTuple
+
+try:
+    # Optional accelerator: one automaton pass over the text instead of a
+    # backtracking regex scan. Core stays stdlib-only when it is absent.
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional drop-in engine: the third-party `regex` module compiles large
+    # literal alternations to a faster matcher than stdlib `re`.
+    import regex as _regex  # type: ignore
+except ImportError:
+    _regex = None
+
+try:
+    # Optional faster JSON codec for the terms file.
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 
 DEFAULT_TERMS: dict[str, list[str]] = {
@@ -31,9 +57,15 @@ DEFAULT_TERMS: dict[str, list[str]] = {
 
 _TAG_SPLIT_RE = re.compile(r"(<[^>]+>)")
 
+# How long a stat() result is trusted before re-checking the terms file.
+# In-process writes via add_term invalidate explicitly, so the TTL only
+# delays pickup of *external* edits to the JSON.
+_STAT_TTL_S = 2.0
+_STAT_CACHE: dict[str, tuple[float, int, int]] = {}
 
-def _get_terms_path() -> Path:
-    override = os.environ.get("TERM_FIXER_TERMS_PATH")
+
+@lru_cache(maxsize=8)
+def _terms_path_for(override: str | None) -> Path:
     if override:
         return Path(override).expanduser()
     # Default to a repo-local dictionary so all "server files" live together.
@@ -41,12 +73,55 @@ def _get_terms_path() -> Path:
     return Path(__file__).resolve().parent / "data" / "product-terms.json"
 
 
+def _get_terms_path() -> Path:
+    # Keyed on the raw env value, so flipping TERM_FIXER_TERMS_PATH at runtime
+    # (as the tests do) still resolves the right file.
+    return _terms_path_for(os.environ.get("TERM_FIXER_TERMS_PATH"))
+
+
+def _json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dump_bytes(obj: Any) -> bytes:
+    # Both branches produce 2-space-indented UTF-8 in insertion order.
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n"
+    return (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def _fsync_fd(fd: int) -> None:
+    if fcntl is not None and hasattr(fcntl, "F_FULLFSYNC"):
+        # On macOS plain fsync may leave data in the drive cache.
+        fcntl.fcntl(fd, fcntl.F_FULLFSYNC)
+    else:
+        os.fsync(fd)
+
+
 def _atomic_write_json(path: Path, obj: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    # Insertion order is stable (dict semantics since 3.7), so re-sorting on
+    # every write buys nothing.
+    data = _json_dump_bytes(obj)
+
+    # write + fsync(file) + rename + fsync(dir): without the syncs a crash
+    # around os.replace can leave an empty or truncated terms file.
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        _fsync_fd(fd)
+    finally:
+        os.close(fd)
     os.replace(tmp, path)
 
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(path.parent, os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
 
 def _ensure_terms_file(path: Path) -> None:
     if path.exists():
@@ -56,7 +131,7 @@ def _ensure_terms_file(path: Path) -> None:
 
 def _load_terms(path: Path) -> dict[str, list[str]]:
     _ensure_terms_file(path)
-    raw = json.loads(path.read_text(encoding="utf-8"))
+    raw = _json_loads(path.read_bytes())
     if not isinstance(raw, dict):
         raise ValueError(f"Terms file must be a JSON object: {path}")
 
@@ -73,19 +148,155 @@ def _load_terms(path: Path) -> dict[str, list[str]]:
 
 
 def _dedup_preserve_order(items: Iterable[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
+    # dict preserves insertion order and setdefault keeps the first spelling
+    # seen for each casefolded key, all in C.
+    seen: dict[str, str] = {}
     for x in items:
-        key = x.casefold()
-        if key in seen:
+        seen.setdefault(x.casefold(), x)
+    return list(seen.values())
+
+
+class _Rules(NamedTuple):
+    """Dispatch table compiled once per (path, mtime) from the terms dict.
+
+    `mapping` is the replacement table: one hash of the casefolded match is
+    the entire dispatch cost (Python's string-keyed dict is already a
+    near-perfect hash with cached str hashes).
+    """
+
+    pattern: Any  # re.Pattern[str], or regex.Pattern when `regex` is installed
+    mapping: dict[str, str]
+    # Case-sensitive twin of `pattern` over lowercased variants: matching on
+    # pre-lowered text skips the engine's per-character case-folding. Only
+    # sound when every variant spelling and the text are ASCII, where
+    # lower(), casefold() and IGNORECASE's full folding all agree.
+    pattern_cs: Any
+    cs_mapping: dict[str, str]
+    ascii_variants: bool
+    automaton: Any
+    first_chars: frozenset[str]
+    # 64-bit Bloom filter of 2-char shingles across all variants; None when a
+    # variant is too short to shingle (filter would miss it).
+    bloom: int | None
+    # Substitution callback for `pattern`, built once at compile time so no
+    # closure is allocated per fix_terms call.
+    replace: Any
+
+
+def _match_key(s: str) -> str:
+    # str.lower and str.casefold agree on ASCII, and lower() takes the C fast
+    # path there; full casefolding is only needed for non-ASCII matches.
+    return s.lower() if s.isascii() else s.casefold()
+
+
+def _is_word_char(ch: str) -> bool:
+    # Mirrors `\b` semantics in the regex path.
+    return ch.isalnum() or ch == "_"
+
+
+def _shingle_bits(s: str) -> int:
+    bits = 0
+    for a, b in zip(s, s[1:]):
+        bits |= 1 << ((ord(a) * 131 + ord(b)) & 63)
+    return bits
+
+
+def _build_automaton(mapping: dict[str, str]) -> Any:
+    if ahocorasick is None or not mapping:
+        return None
+    automaton = ahocorasick.Automaton()
+    for variant, correct in mapping.items():
+        # `\b` inverts next to non-word chars (e.g. ".net" needs a *word*
+        # char before it), so record the word-ness of each edge for the
+        # boundary checks in _ac_sub.
+        automaton.add_word(
+            variant,
+            (len(variant), correct, _is_word_char(variant[0]), _is_word_char(variant[-1])),
+        )
+    automaton.make_automaton()
+    return automaton
+
+
+def _ac_sub(part: str, automaton: Any) -> str | None:
+    """Replace variants in `part` with one automaton pass.
+
+    Returns None when the part cannot be matched safely (casefolding changed
+    its length), in which case the caller falls back to the regex path.
+    """
+    lowered = part.casefold()
+    n = len(lowered)
+    if n != len(part):
+        return None
+
+    # The scan itself runs in pyahocorasick's C automaton; keep the per-match
+    # Python work minimal by binding lookups outside the loop.
+    is_word_char = _is_word_char
+    matches: list[tuple[int, int, str]] = []
+    append = matches.append
+    for end, (vlen, correct, left_word, right_word) in automaton.iter(lowered):
+        start = end - vlen + 1
+        # `\b` holds iff word-ness flips across the edge; string ends count
+        # as non-word, so e.g. ".net" never matches at the very start.
+        if (start > 0 and is_word_char(lowered[start - 1])) == left_word:
             continue
-        seen.add(key)
-        out.append(x)
-    return out
+        if (end + 1 < n and is_word_char(lowered[end + 1])) == right_word:
+            continue
+        append((start, end + 1, correct))
+    if not matches:
+        return part
+
+    # Leftmost-longest, like the longest-first alternation in the regex path.
+    matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+    out: list[str] = []
+    pos = 0
+    for start, end, correct in matches:
+        if start < pos:
+            continue
+        out.append(part[pos:start])
+        out.append(correct)
+        pos = end
+    out.append(part[pos:])
+    return "".join(out)
+
+
+def _cs_sub(text: str, lower: str, rules: _Rules) -> str:
+    """Match the case-sensitive pattern on pre-lowered text and splice
+    replacements back into the original-case text via match offsets."""
+    out: list[str] = []
+    pos = 0
+    changed = False
+    cs_mapping = rules.cs_mapping
+    for m in rules.pattern_cs.finditer(lower):
+        start, end = m.span()
+        out.append(text[pos:start])
+        if m.group(1) is not None:
+            # Tag: pass the original slice through unchanged.
+            out.append(text[start:end])
+        else:
+            out.append(cs_mapping[m.group(0)])
+            changed = True
+        pos = end
+    if not changed:
+        # Only tags (or nothing) matched: skip the fragment join entirely.
+        return text
+    out.append(text[pos:])
+    return "".join(out)
 
 
-def _compile_rules(terms: dict[str, list[str]]) -> list[tuple[re.Pattern[str], str, int]]:
-    rules: list[tuple[re.Pattern[str], str, int]] = []
+def _apply_rules(part: str, rules: _Rules) -> str:
+    if rules.automaton is not None:
+        replaced = _ac_sub(part, rules.automaton)
+        if replaced is not None:
+            return replaced
+    # A tag never survives inside a segment, so group 1 is inert here.
+    return rules.pattern.sub(rules.replace, part)
+
+
+def _compile_rules(terms: dict[str, list[str]]) -> _Rules:
+    mapping: dict[str, str] = {}
+    cs_mapping: dict[str, str] = {}
+    extra_spellings: set[str] = set()
+    ascii_variants = True
     for correct, variants in terms.items():
         if not isinstance(correct, str) or not correct.strip():
             continue
@@ -96,49 +307,161 @@ def _compile_rules(terms: dict[str, list[str]]) -> list[tuple[re.Pattern[str], s
             vv = v.strip()
             if not vv:
                 continue
-            pat = re.compile(rf"\b{re.escape(vv)}\b", re.IGNORECASE)
-            rules.append((pat, correct, len(vv)))
-
-    # Longest first to avoid partial overlaps (best-effort).
-    rules.sort(key=lambda t: t[2], reverse=True)
-    return rules
+            # Judged on the original spelling: "ß".casefold() is ASCII but
+            # matching it needs full folding, which the fast paths skip.
+            ascii_variants = ascii_variants and vv.isascii()
+            mapping.setdefault(vv.casefold(), correct)
+            cs_mapping.setdefault(vv.lower(), correct)
+            # IGNORECASE only does simple (1:1) folding, so a branch built
+            # from the casefolded key cannot match spellings like "straße"
+            # where casefold expands characters; keep those spellings as
+            # branches of their own.
+            if vv.casefold() != vv.lower():
+                extra_spellings.add(vv.lower())
+
+    # The engine tries alternation branches leftmost-first, so a shorter
+    # variant sharing a prefix (e.g. "Wispr") would shadow a longer one
+    # ("Wispr Flow") unless longer branches come first. The alphabetical
+    # tie-break just makes the compiled pattern deterministic.
+    ordered = sorted(mapping.keys() | extra_spellings, key=lambda v: (-len(v), v))
+    # Group 1 captures HTML tags so the callback can pass them through
+    # unchanged: tag skipping and replacement fuse into one traversal.
+    engine = _regex if _regex is not None else re
+    pattern = engine.compile(
+        r"(<[^>]+>)|\b(?:" + "|".join(re.escape(v) for v in ordered) + r")\b",
+        re.IGNORECASE,
+    )
+    ordered_cs = sorted(cs_mapping, key=lambda v: (-len(v), v))
+    pattern_cs = engine.compile(
+        r"(<[^>]+>)|\b(?:" + "|".join(re.escape(v) for v in ordered_cs) + r")\b"
+    )
+    # Pre-filters are checked against text.lower(), so they are only sound
+    # when lower() and casefold() agree for every variant. That is judged on
+    # the original spellings (ascii_variants), not the casefolded keys: "ß"
+    # casefolds to ASCII "ss" yet needs full folding to match. An empty
+    # first_chars disables both filters.
+    first_chars = frozenset(v[0] for v in mapping) if mapping and ascii_variants else frozenset()
+    bloom: int | None = None
+    if first_chars and all(len(v) >= 2 for v in mapping):
+        bloom = 0
+        for v in mapping:
+            bloom |= _shingle_bits(v)
+
+    def replace(m: Any) -> str:
+        return m.group(1) or mapping[_match_key(m.group(0))]
+
+    return _Rules(
+        pattern,
+        mapping,
+        pattern_cs,
+        cs_mapping,
+        ascii_variants,
+        _build_automaton(mapping),
+        first_chars,
+        bloom,
+        replace,
+    )
 
 
 @lru_cache(maxsize=16)
-def _compiled_rules_for(path_str: str, mtime_ns: int) -> tuple[tuple[re.Pattern[str], str], ...]:
-    # mtime_ns is part of cache key: edits to the JSON invalidate the compiled rules automatically.
+def _compiled_rules_for(path_str: str, mtime_ns: int, size: int) -> _Rules:
+    # (mtime_ns, size) is part of cache key: edits to the JSON invalidate the
+    # compiled rules automatically; the JSON is only reread and reparsed on a
+    # key change, never per call. size catches edits that a filesystem with
+    # coarse mtime granularity would otherwise hide.
     terms = _load_terms(Path(path_str))
-    rules = _compile_rules(terms)
-    return tuple((pat, repl) for pat, repl, _ in rules)
+    return _compile_rules(terms)
 
 
-def fix_terms(text: str) -> str:
-    """Normalize product/tool names in `text` using the user-scope terms dictionary."""
-    if not text:
-        return text
+def _terms_stat(path: Path) -> tuple[int, int]:
+    path_str = str(path)
+    now = time.monotonic()
+    cached = _STAT_CACHE.get(path_str)
+    if cached is not None and now - cached[0] < _STAT_TTL_S:
+        return cached[1], cached[2]
 
-    path = _get_terms_path()
     _ensure_terms_file(path)
     try:
-        mtime_ns = path.stat().st_mtime_ns
+        st = path.stat()
     except FileNotFoundError:
         # If the file disappears between ensure+stat, re-create and retry.
         _ensure_terms_file(path)
-        mtime_ns = path.stat().st_mtime_ns
+        st = path.stat()
+    _STAT_CACHE[path_str] = (now, st.st_mtime_ns, st.st_size)
+    return st.st_mtime_ns, st.st_size
 
-    rules = _compiled_rules_for(str(path), mtime_ns)
 
-    # Avoid mutating HTML tags/attributes: only apply replacements to text segments.
-    parts = _TAG_SPLIT_RE.split(text)
-    for i, part in enumerate(parts):
-        if not part or (part.startswith("<") and part.endswith(">")):
-            continue
-        updated = part
-        for pat, repl in rules:
-            updated = pat.sub(repl, updated)
-        parts[i] = updated
+def fix_terms(text: str) -> str:
+    """Normalize product/tool names in `text` using the user-scope terms dictionary."""
+    if not text:
+        return text
+
+    path = _get_terms_path()
+    mtime_ns, size = _terms_stat(path)
+    return _fix_terms_cached(text, str(path), mtime_ns, size)
+
+
+@lru_cache(maxsize=1024)
+def _fix_terms_cached(text: str, path_str: str, mtime_ns: int, size: int) -> str:
+    # MCP clients routinely re-send identical prompts/snippets; memoizing the
+    # normalized output skips the whole matching pass. (mtime_ns, size) in the
+    # key invalidates entries whenever the terms file changes.
+    rules = _compiled_rules_for(path_str, mtime_ns, size)
+    if not rules.mapping:
+        return text
 
-    return "".join(parts)
+    # Cheap pre-filter: most texts contain none of the tracked variants, so
+    # bail before entering the matcher. The text is lowered once here and the
+    # same string feeds the case-sensitive matcher below. Restricted to ASCII
+    # text against ASCII variants, the checks only produce false positives
+    # (extra matcher runs), never false negatives; non-ASCII text could hide
+    # a match behind full folding (e.g. "ſ" for "s"), so it skips straight
+    # to the matcher.
+    lower = text.lower()
+    text_ascii = text.isascii()
+    if text_ascii and rules.first_chars and rules.first_chars.isdisjoint(lower):
+        return text
+    if text_ascii and rules.bloom is not None:
+        for a, b in zip(lower, lower[1:]):
+            if (rules.bloom >> ((ord(a) * 131 + ord(b)) & 63)) & 1:
+                break
+        else:
+            return text
+
+    if rules.automaton is None:
+        # Tag skipping is fused into the pattern (group 1), so the whole text
+        # goes through the engine in one pass with no segment list at all.
+        # Matching case-sensitively on the lowered copy skips the engine's
+        # per-character case-folding, but is only equivalent to IGNORECASE
+        # when both the variants and the text are ASCII ("Curſer" must still
+        # fold to "curser"); anything else takes the IGNORECASE pattern.
+        if rules.ascii_variants and text_ascii:
+            return _cs_sub(text, lower, rules)
+        return rules.pattern.sub(rules.replace, text)
+
+    # Automaton path: it has no tag awareness, so stream over tag matches and
+    # apply replacements to the text segments between them.
+    out: list[str] = []
+    pos = 0
+    changed = False
+    for m in _TAG_SPLIT_RE.finditer(text):
+        if pos < m.start():
+            segment = text[pos : m.start()]
+            replaced = _apply_rules(segment, rules)
+            changed = changed or replaced is not segment
+            out.append(replaced)
+        out.append(m.group(0))
+        pos = m.end()
+    if pos == 0:
+        return _apply_rules(text, rules)
+    if pos < len(text):
+        segment = text[pos:]
+        replaced = _apply_rules(segment, rules)
+        changed = changed or replaced is not segment
+        out.append(replaced)
+    # If every segment came back untouched, hand the original text back
+    # instead of paying for the join copy.
+    return "".join(out) if changed else text
 
 
 def add_term(correct: str, wrong_variants: list[str]) -> str:
@@ -165,6 +488,9 @@ def add_term(correct: str, wrong_variants: list[str]) -> str:
     terms[canonical_key] = merged
 
     _atomic_write_json(path, terms)
+    # Force the next fix_terms call to pick up the new mapping immediately
+    # instead of waiting out the stat TTL.
+    _STAT_CACHE.pop(str(path), None)
     return "ok"
 
 
@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Some Python/pytest setups do not include the project root on sys.path when
 # running via the `pytest` entrypoint script. Ensure the module is importable.
 ROOT = Path(__file__).resolve().parents[1]
@@ -8,6 +10,31 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 
+# Optional-dependency attributes to force to None so every matcher path is
+# exercised regardless of what happens to be installed. The empty tuple keeps
+# whatever the environment provides (automaton and/or regex engine).
+MATCHER_CONFIGS = [
+    pytest.param((), id="as-installed"),
+    pytest.param(("ahocorasick",), id="no-automaton"),
+    pytest.param(("_regex",), id="no-regex-engine"),
+    pytest.param(("ahocorasick", "_regex"), id="stdlib-only"),
+]
+
+
+def _fresh_term_fixer(tmp_path, monkeypatch, disable=()):
+    monkeypatch.setenv("TERM_FIXER_TERMS_PATH", str(tmp_path / "product-terms.json"))
+
+    import term_fixer
+
+    for name in disable:
+        monkeypatch.setattr(term_fixer, name, None)
+    # Compiled rules bake the optional deps in, so drop anything cached.
+    term_fixer._compiled_rules_for.cache_clear()
+    term_fixer._fix_terms_cached.cache_clear()
+    term_fixer._STAT_CACHE.clear()
+    return term_fixer
+
+
 def test_fix_terms_basic(tmp_path, monkeypatch):
     monkeypatch.setenv("TERM_FIXER_TERMS_PATH", str(tmp_path / "product-terms.json"))
 
@@ -41,6 +68,54 @@ def test_add_term_roundtrip(tmp_path, monkeypatch):
     assert term_fixer.fix_terms("I like foobar") == "I like FooBar"
 
 
+@pytest.mark.parametrize("disable", MATCHER_CONFIGS)
+def test_matcher_paths_agree(tmp_path, monkeypatch, disable):
+    term_fixer = _fresh_term_fixer(tmp_path, monkeypatch, disable)
+
+    assert term_fixer.fix_terms("Cloudcode, Antygravity and curser") == "Claude Code, Antigravity and Cursor"
+    assert term_fixer.fix_terms("nothing tracked in this sentence") == "nothing tracked in this sentence"
+    out = term_fixer.fix_terms('<a href="/Cloudcode" title="Curser">Cloudcode</a>')
+    assert out == '<a href="/Cloudcode" title="Curser">Claude Code</a>'
+
+
+@pytest.mark.parametrize("disable", MATCHER_CONFIGS)
+def test_unicode_fold_parity(tmp_path, monkeypatch, disable):
+    # U+017F (long s) casefolds to "s"; every path must agree with IGNORECASE.
+    term_fixer = _fresh_term_fixer(tmp_path, monkeypatch, disable)
+
+    assert term_fixer.fix_terms("Curſer") == "Cursor"
+
+
+@pytest.mark.parametrize("disable", MATCHER_CONFIGS)
+def test_non_word_edge_variants_follow_word_boundaries(tmp_path, monkeypatch, disable):
+    term_fixer = _fresh_term_fixer(tmp_path, monkeypatch, disable)
+    term_fixer.add_term(".NET", [".Net"])
+
+    # \b before "." requires a *word* character on the left, so a match after
+    # a space (or at the start of the text) must not fire.
+    assert term_fixer.fix_terms("use .net now") == "use .net now"
+    assert term_fixer.fix_terms(".net leads") == ".net leads"
+    assert term_fixer.fix_terms("type.net here") == "type.NET here"
+
+
+@pytest.mark.parametrize("disable", MATCHER_CONFIGS)
+def test_unclosed_tag_is_still_replaced(tmp_path, monkeypatch, disable):
+    term_fixer = _fresh_term_fixer(tmp_path, monkeypatch, disable)
+
+    out = term_fixer.fix_terms("a <b>Curser</b> and 3 < 4 with Cloudcode")
+    assert out == "a <b>Cursor</b> and 3 < 4 with Claude Code"
+
+
+def test_add_term_bypasses_stat_ttl(tmp_path, monkeypatch):
+    term_fixer = _fresh_term_fixer(tmp_path, monkeypatch)
+
+    # Prime the stat cache, then add a term: the change must be visible
+    # immediately, not after the TTL expires.
+    assert term_fixer.fix_terms("zzglorp") == "zzglorp"
+    term_fixer.add_term("Glorp", ["zzglorp"])
+    assert term_fixer.fix_terms("zzglorp") == "Glorp"
+
+
 def test_env_override_path_is_respected(tmp_path, monkeypatch):
     # Ensure we never touch the real ~/.claude/data in tests.
     terms_path = tmp_path / "some" / "nested" / "terms.json"